@@ -1,4 +1,6 @@
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from unittest import mock
 
@@ -9,6 +11,7 @@ from xsdata.codegen.mappers.dict import DictMapper
 from xsdata.codegen.mappers.element import ElementMapper
 from xsdata.codegen.mappers.schema import SchemaMapper
 from xsdata.codegen.parsers import DefinitionsParser
+from xsdata.codegen.transformer import is_child_process
 from xsdata.codegen.transformer import SchemaTransformer
 from xsdata.codegen.utils import ClassUtils
 from xsdata.codegen.writer import CodeWriter
@@ -90,13 +93,89 @@ class SchemaTransformerTests(FactoryTestCase):
         mock_convert_definitions.assert_called_once_with(fist_def)
 
     @mock.patch.object(SchemaTransformer, "process_schema")
-    def test_process_schemas(self, mock_process_schema):
+    @mock.patch.object(SchemaTransformer, "preparse_schemas")
+    def test_process_schemas(self, mock_preparse_schemas, mock_process_schema):
         uris = ["http://xsdata/foo.xsd", "http://xsdata/bar.xsd"]
 
         self.transformer.process_schemas(uris)
 
+        self.assertEqual(0, mock_preparse_schemas.call_count)
         mock_process_schema.assert_has_calls([mock.call(uri) for uri in uris])
 
+        self.transformer.config.output.parallel_parsing = True
+        self.transformer.process_schemas(uris)
+
+        mock_preparse_schemas.assert_called_once_with(uris)
+
+    @mock.patch("xsdata.codegen.transformer.os.cpu_count", return_value=2)
+    def test_preparse_schemas(self, *_):
+        fixtures = Path(__file__).parent.parent.joinpath("fixtures")
+        books = fixtures.joinpath("books/schema.xsd").resolve().as_uri()
+        hello = fixtures.joinpath("hello/hello.xsd").resolve().as_uri()
+        missing = fixtures.joinpath("missing.xsd").resolve().as_uri()
+
+        self.transformer.preparse_schemas([missing, books])
+        self.assertEqual({}, self.transformer.preparsed)
+        self.assertEqual([books], list(self.transformer.preloaded))
+
+        self.transformer.preparse_schemas([books, hello, missing])
+        self.assertEqual([books, hello], list(self.transformer.preparsed))
+        self.assertEqual([books, hello], list(self.transformer.preloaded))
+
+        expected = SchemaTransformer(print=True, config=self.transformer.config)
+        for uri in (books, hello):
+            self.assertEqual(
+                expected.parse_schema(uri, None),
+                self.transformer.parse_schema(uri, None),
+            )
+
+        self.assertEqual({}, self.transformer.preparsed)
+        self.assertEqual({}, self.transformer.preloaded)
+
+    @mock.patch("xsdata.codegen.transformer.os.cpu_count", return_value=2)
+    @mock.patch("xsdata.codegen.transformer.ProcessPoolExecutor")
+    def test_preparse_schemas_without_process_pool(self, mock_executor, *_):
+        self.transformer.preloaded = {"a.xsd": b"a", "b.xsd": b"b"}
+        self.transformer.processed = ["c.xsd"]
+
+        errors = [NotImplementedError, BrokenProcessPool, OSError]
+        mock_executor.side_effect = errors
+        for _ in errors:
+            self.transformer.preparse_schemas(["a.xsd", "b.xsd", "c.xsd"])
+
+        self.assertEqual(len(errors), mock_executor.call_count)
+        mock_executor.assert_called_with(max_workers=2)
+        self.assertEqual({}, self.transformer.preparsed)
+
+        mock_executor.side_effect = RuntimeError
+        with self.assertRaises(RuntimeError):
+            self.transformer.preparse_schemas(["a.xsd", "b.xsd"])
+
+    @mock.patch("xsdata.codegen.transformer.is_child_process", return_value=True)
+    @mock.patch("xsdata.codegen.transformer.os.cpu_count", return_value=2)
+    @mock.patch("xsdata.codegen.transformer.ProcessPoolExecutor")
+    def test_preparse_schemas_in_child_process(self, mock_executor, *_):
+        self.transformer.preloaded = {"a.xsd": b"a", "b.xsd": b"b"}
+        self.transformer.preparse_schemas(["a.xsd", "b.xsd"])
+
+        self.assertEqual(0, mock_executor.call_count)
+        self.assertEqual({}, self.transformer.preparsed)
+
+    def test_is_child_process(self):
+        self.assertFalse(is_child_process())
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            self.assertTrue(executor.submit(is_child_process).result())
+
+    @mock.patch("xsdata.codegen.transformer.os.cpu_count", return_value=1)
+    @mock.patch("xsdata.codegen.transformer.ProcessPoolExecutor")
+    def test_preparse_schemas_with_single_worker(self, mock_executor, *_):
+        self.transformer.preloaded = {"a.xsd": b"a", "b.xsd": b"b"}
+        self.transformer.preparse_schemas(["a.xsd", "b.xsd"])
+
+        self.assertEqual(0, mock_executor.call_count)
+        self.assertEqual({}, self.transformer.preparsed)
+
     @mock.patch.object(ClassUtils, "reduce_classes")
     @mock.patch.object(ElementMapper, "map")
     @mock.patch.object(TreeParser, "from_bytes")
@@ -301,6 +380,20 @@ class SchemaTransformerTests(FactoryTestCase):
         self.assertEqual(2, len(schema.complex_types))
         self.assertIsNone(self.transformer.parse_schema(uri, None))  # Once
 
+    def test_parse_schema_with_preparsed_schema(self):
+        uri = Path(__file__).parent.joinpath("../fixtures/books/schema.xsd").as_uri()
+        schema = Schema()
+        self.transformer.preparsed[uri] = schema
+
+        actual = self.transformer.parse_schema(uri, "foo.bar")
+        self.assertIsNot(schema, actual)
+        self.assertEqual(2, len(actual.complex_types))
+        self.assertEqual({}, self.transformer.preparsed)
+
+        self.transformer.processed.clear()
+        self.transformer.preparsed[uri] = schema
+        self.assertIs(schema, self.transformer.parse_schema(uri, None))
+
     @mock.patch.object(SchemaTransformer, "process_schema")
     @mock.patch.object(Definitions, "merge")
     @mock.patch.object(DefinitionsParser, "from_bytes")
@@ -1,13 +1,33 @@
+import itertools
 import json
+from datetime import date
+from datetime import datetime
+from io import StringIO
+from unittest import mock
 from unittest.case import TestCase
+from xml.etree.ElementTree import QName
 
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
 from tests.fixtures.datatypes import Telephone
+from tests.fixtures.models import AttrsType
+from tests.fixtures.models import ChoiceType
+from tests.fixtures.models import ExtendedType
+from tests.fixtures.models import SequentialType
+from tests.fixtures.models import TypeA
+from tests.fixtures.models import TypeC
+from tests.fixtures.models import TypeD
+from xsdata.codegen.models import Status
+from xsdata.exceptions import ConverterError
+from xsdata.exceptions import SerializerError
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.serializers.json import DictFactory
 from xsdata.formats.dataclass.serializers.json import JsonSerializer
+from xsdata.formats.dataclass.serializers.json import orjson_dump
+from xsdata.formats.dataclass.serializers.json import orjson_dumps
 from xsdata.models.datatype import XmlDate
+from xsdata.models.datatype import XmlHexBinary
+from xsdata.models.enums import UseType
 from xsdata.models.xsd import Attribute
 from xsdata.utils.testing import XmlVarFactory
 
@@ -65,6 +85,47 @@ class JsonSerializerTests(TestCase):
 
         self.assertEqual(self.expected, json.loads(actual))
 
+    def test_render_with_default_dump_factory(self):
+        serializer = JsonSerializer()
+        objects = [
+            TypeC(x=2 ** 70, y="\u03b1\u00e9", z=float("nan")),
+            TypeC(x=-(2 ** 70), y="a", z=float("inf")),
+            [TypeC(x=1, y="b", z=float("-inf"))],
+        ]
+
+        for obj, indent in itertools.product(objects, (None, 2)):
+            serializer.indent = indent
+            expected = json.dumps(serializer.convert(obj), indent=indent)
+            self.assertEqual(expected, serializer.render(obj))
+
+            output = StringIO()
+            serializer.write(output, obj)
+            self.assertEqual(expected, output.getvalue())
+
+        self.assertEqual(
+            '{"x": 1180591620717411303424, "y": "\\u03b1\\u00e9", "z": NaN, '
+            '"fixed": "ignored"}',
+            JsonSerializer().render(objects[0]),
+        )
+
+    @mock.patch.object(JsonSerializer, "write_stream")
+    @mock.patch.object(JsonSerializer, "write")
+    def test_render_with_json_dump_factory(self, mock_write, mock_write_stream):
+        serializer = JsonSerializer(indent=2)
+        actual = serializer.render(self.books)
+
+        self.assertEqual(json.dumps(serializer.convert(self.books), indent=2), actual)
+        self.assertEqual(0, mock_write.call_count)
+        self.assertEqual(0, mock_write_stream.call_count)
+
+    def test_render_with_custom_dump_factory(self):
+        dump_factory = mock.Mock(wraps=json.dump)
+        serializer = JsonSerializer(dump_factory=dump_factory, indent=2)
+        actual = serializer.render(self.books)
+
+        self.assertEqual(json.dumps(serializer.convert(self.books), indent=2), actual)
+        dump_factory.assert_called_once()
+
     def test_render_a_none_dataclass_object(self):
         with self.assertRaises(XmlContextError):
             JsonSerializer().render(1)
@@ -86,3 +147,305 @@ class JsonSerializerTests(TestCase):
         serializer = JsonSerializer(dict_factory=DictFactory.FILTER_NONE)
         actual = serializer.convert(Telephone(30, 234, 56783), var)
         self.assertEqual("30-234-56783", actual)
+
+    def test_convert_with_var(self):
+        var = XmlVarFactory.create(types=(object,), any_type=True)
+        serializer = JsonSerializer()
+
+        self.assertIsNone(serializer.convert(None, var))
+        self.assertEqual(1, serializer.convert(1, var))
+        self.assertEqual({"a": 1}, serializer.convert({"a": 1}, var))
+        self.assertEqual(
+            (1, "optional"), serializer.convert((1, UseType.OPTIONAL), var)
+        )
+        self.assertEqual("bk001", serializer.convert(self.books.book[0], var)["id"])
+        self.assertEqual("2000-10-01", serializer.convert(XmlDate(2000, 10, 1), var))
+
+    def test_convert_with_arrays(self):
+        class Items(list):
+            pass
+
+        var = XmlVarFactory.create(types=(object,), any_type=True)
+        serializer = JsonSerializer()
+
+        actual = serializer.convert([UseType.OPTIONAL, (1, UseType.REQUIRED)], var)
+        self.assertEqual(["optional", (1, "required")], actual)
+
+        actual = serializer.convert(Items([UseType.OPTIONAL]), var)
+        self.assertIsInstance(actual, Items)
+        self.assertEqual(["optional"], actual)
+
+        actual = serializer.convert(Items(self.books.book))
+        self.assertEqual(serializer.convert(self.books.book), actual)
+
+    def test_serialize_value(self):
+        serializer = JsonSerializer()
+        self.assertEqual("{a}b", serializer.serialize_value(QName("a", "b"), None))
+        self.assertEqual(
+            "2000-10-01", serializer.serialize_value(XmlDate(2000, 10, 1), None)
+        )
+        self.assertEqual("2021", serializer.serialize_value(date(2021, 1, 1), "%Y"))
+        self.assertEqual(
+            "666F6F", serializer.serialize_value(XmlHexBinary(b"foo"), None)
+        )
+        self.assertEqual("Zm9v", serializer.serialize_value(b"foo", "base64"))
+        self.assertIsNone(serializer.serialize_value(None, None))
+
+        with self.assertRaises(ConverterError):
+            serializer.serialize_value(datetime(2021, 1, 1), None)
+
+    def test_find_vars(self):
+        serializer = JsonSerializer()
+        actual = serializer.find_vars(BookForm)
+        expected = tuple(serializer.context.build(BookForm).get_all_vars())
+
+        self.assertEqual(expected, actual)
+        self.assertIs(actual, serializer.find_vars(BookForm))
+        self.assertEqual({BookForm: actual}, serializer.vars_cache)
+
+    def test_caches_are_excluded_from_repr_and_compare(self):
+        serializer = JsonSerializer()
+        other = JsonSerializer(context=serializer.context)
+        serializer.convert(self.books)
+
+        self.assertTrue(serializer.encoders)
+        self.assertEqual(other, serializer)
+        self.assertNotIn("vars_cache", repr(serializer))
+        self.assertNotIn("encoders", repr(serializer))
+
+    def test_build_encoder(self):
+        serializer = JsonSerializer(dict_factory=DictFactory.FILTER_NONE)
+        encoder = serializer.build_encoder(BookForm)
+
+        self.assertEqual({BookForm: encoder}, serializer.encoders)
+        self.assertEqual(self.expected["book"][0], encoder(self.books.book[0]))
+
+        serializer.dict_factory = dict
+        actual = encoder(self.books.book[1])
+        self.assertIsNone(actual["price"])
+
+        serializer.dict_factory = mock.Mock(return_value={})
+        encoder(self.books.book[1])
+        pairs = serializer.dict_factory.call_args[0][0]
+        self.assertEqual(list(actual.items()), pairs)
+
+    @mock.patch.object(JsonSerializer, "build_primitive_encoder")
+    def test_build_encoder_with_primitive_vars(self, mock_build_primitive_encoder):
+        serializer = JsonSerializer()
+        encoder = serializer.build_encoder(TypeC)
+
+        self.assertEqual(mock_build_primitive_encoder.return_value, encoder)
+        xml_vars, fallback = mock_build_primitive_encoder.call_args[0][1:]
+        self.assertEqual(serializer.find_vars(TypeC), xml_vars)
+        self.assertEqual(
+            {"x": 1, "y": "a", "z": 1.5, "fixed": "ignored"},
+            fallback(TypeC(1, "a", 1.5)),
+        )
+
+        serializer.build_encoder(BookForm)
+        self.assertEqual(1, mock_build_primitive_encoder.call_count)
+
+    def test_build_primitive_encoder(self):
+        serializer = JsonSerializer()
+        xml_vars = serializer.find_vars(TypeD)
+        fallback = mock.Mock(return_value="fallback")
+        encoder = serializer.build_primitive_encoder(TypeD, xml_vars, fallback)
+
+        self.assertEqual({"x": 1, "y": "a", "z": None}, encoder(TypeD(1, "a", None)))
+        self.assertEqual("fallback", encoder(TypeD(1, "a", UseType.OPTIONAL)))
+        fallback.assert_called_once()
+
+        serializer.dict_factory = DictFactory.FILTER_NONE
+        self.assertEqual({"x": 1, "y": "a"}, encoder(TypeD(1, "a", None)))
+
+    def test_is_primitive_var(self):
+        var = XmlVarFactory.create(types=(int, str, bool, float))
+        self.assertTrue(JsonSerializer.is_primitive_var(var))
+
+        var = XmlVarFactory.create(name="class", types=(int,))
+        self.assertFalse(JsonSerializer.is_primitive_var(var))
+
+        var = XmlVarFactory.create(name="foo-bar", types=(int,))
+        self.assertFalse(JsonSerializer.is_primitive_var(var))
+
+        var = XmlVarFactory.create(types=(int,), format="%d")
+        self.assertFalse(JsonSerializer.is_primitive_var(var))
+
+        var = XmlVarFactory.create(types=(int,), factory=list)
+        self.assertFalse(JsonSerializer.is_primitive_var(var))
+
+        var = XmlVarFactory.create(types=(dict,))
+        self.assertFalse(JsonSerializer.is_primitive_var(var))
+
+    def test_build_value_encoder(self):
+        serializer = JsonSerializer()
+
+        var = XmlVarFactory.create(types=(int, str))
+        encode = serializer.build_value_encoder(var)
+        self.assertEqual(1, encode(1))
+        self.assertEqual("2000-10-01", encode(XmlDate(2000, 10, 1)))
+
+        var = XmlVarFactory.create(types=(UseType,))
+        encode = serializer.build_value_encoder(var)
+        self.assertEqual("optional", encode(UseType.OPTIONAL))
+        self.assertEqual("foo", encode("foo"))
+
+        var = XmlVarFactory.create(types=(XmlDate,))
+        encode = serializer.build_value_encoder(var)
+        self.assertEqual("2000-10-01", encode(XmlDate(2000, 10, 1)))
+        self.assertEqual(1, encode(1))
+        self.assertIsNone(encode(None))
+
+        var = XmlVarFactory.create(types=(XmlDate,), factory=list)
+        encode = serializer.build_value_encoder(var)
+        self.assertEqual(["2000-10-01"], encode([XmlDate(2000, 10, 1)]))
+
+        var = XmlVarFactory.create(types=(BookForm,))
+        encode = serializer.build_value_encoder(var)
+        self.assertEqual("bk001", encode(self.books.book[0])["id"])
+
+        var = XmlVarFactory.create(types=(BookForm, int), clazz=BookForm, factory=list)
+        encode = serializer.build_value_encoder(var)
+        actual = encode([self.books.book[1], 1, None, UseType.OPTIONAL])
+        self.assertEqual("bk002", actual[0]["id"])
+        self.assertEqual([1, None, "optional"], actual[1:])
+        self.assertEqual((1, "optional"), encode((1, UseType.OPTIONAL)))
+
+        var = XmlVarFactory.create(types=(Status, UseType))
+        encode = serializer.build_value_encoder(var)
+        self.assertIs(Status.RAW, encode(Status.RAW))
+        self.assertEqual("required", encode(UseType.REQUIRED))
+
+    def test_build_type_handler(self):
+        serializer = JsonSerializer()
+        var = XmlVarFactory.create(types=(date,), format="%d-%m-%Y")
+        convert = mock.Mock(return_value="foo")
+
+        self.assertIsNone(serializer.build_type_handler(list, var, convert))
+
+        handler = serializer.build_type_handler(str, var, convert)
+        self.assertEqual("a", handler("a"))
+
+        handler = serializer.build_type_handler(Status, var, convert)
+        self.assertIs(Status.RAW, handler(Status.RAW))
+
+        handler = serializer.build_type_handler(BookForm, var, convert)
+        self.assertEqual("bk001", handler(self.books.book[0])["id"])
+
+        handler = serializer.build_type_handler(UseType, var, convert)
+        self.assertEqual("foo", handler(UseType.OPTIONAL))
+        convert.assert_called_once_with("optional")
+
+        handler = serializer.build_type_handler(date, var, convert)
+        self.assertEqual("01-10-2000", handler(date(2000, 10, 1)))
+
+    def test_write_with_indent(self):
+        for indent in (None, 2, 4):
+            output = StringIO()
+            serializer = JsonSerializer(
+                dict_factory=DictFactory.FILTER_NONE, indent=indent
+            )
+            serializer.write(output, self.books)
+            actual = output.getvalue()
+
+            self.assertEqual(self.expected, json.loads(actual))
+            self.assertEqual(indent is not None, "\n" in actual)
+
+    def test_write_stream(self):
+        objects = [
+            self.books,
+            self.books.book,
+            [],
+            [self.books.book, []],
+            Attribute(),
+            AttrsType(index=1, attrs={"a": "b", "c": ""}),
+            SequentialType(a1={"1": "2"}, a2=["a", "b"], x1=[1, 2], x2=[]),
+            ChoiceType(choice=[TypeA(1), 1.5, float("nan"), (1, 2), QName("{a}b")]),
+            ExtendedType(a=TypeA(x=2), any={1: [{}], 2.5: None, None: "\u03b1"}),
+            ExtendedType(any={True: False, False: [float("inf"), float("-inf")]}),
+        ]
+        dict_factories = (dict, DictFactory.FILTER_NONE)
+        for obj, dict_factory, indent in itertools.product(
+            objects, dict_factories, (None, 0, 2, "\t")
+        ):
+            serializer = JsonSerializer(dict_factory=dict_factory, indent=indent)
+            output = StringIO()
+            serializer.write_stream(output, obj)
+
+            expected = json.dumps(serializer.convert(obj), indent=indent)
+            self.assertEqual(expected, output.getvalue())
+
+    def test_write_stream_with_invalid_objects(self):
+        serializer = JsonSerializer()
+        with self.assertRaises(XmlContextError):
+            serializer.write_stream(StringIO(), 1)
+
+        with self.assertRaises(TypeError):
+            obj = ExtendedType(any={(1, 2): 1})
+            serializer.write_stream(StringIO(), obj)
+
+        with self.assertRaises(TypeError):
+            serializer.write_stream(StringIO(), ExtendedType(any={"a": object()}))
+
+        serializer.dict_factory = lambda x: dict(x)
+        with self.assertRaises(SerializerError):
+            serializer.write_stream(StringIO(), self.books)
+
+    @mock.patch.object(JsonSerializer, "write_stream")
+    def test_write_with_json_dump_factory(self, mock_write_stream):
+        output = StringIO()
+        serializer = JsonSerializer(dump_factory=json.dump)
+        serializer.write(output, self.books)
+        mock_write_stream.assert_called_once_with(output, self.books)
+
+        serializer.dict_factory = lambda x: dict(x)
+        serializer.write(output, self.books)
+        self.assertEqual(1, mock_write_stream.call_count)
+
+
+class OrjsonDumpTests(TestCase):
+    def test_orjson_dump(self):
+        data = {"a": [1, 2.5, None, True], "b": {"c": "d"}, 1: "e"}
+        expected = json.loads(json.dumps(data))
+
+        for indent in (None, 2, 4):
+            output = StringIO()
+            orjson_dump(data, output, indent=indent)
+            self.assertEqual(expected, json.loads(output.getvalue()))
+
+    def test_orjson_dumps(self):
+        data = {"a": [1, 2.5, None, True], "b": {"c": "d"}, 1: "e"}
+        expected = json.loads(json.dumps(data))
+
+        for indent in (None, 2, 4):
+            actual = orjson_dumps(data, indent=indent)
+            self.assertEqual(expected, json.loads(actual))
+            self.assertEqual(indent is not None, "\n" in actual)
+
+    def test_orjson_dumps_with_large_integers(self):
+        data = {"a": 2 ** 70}
+
+        for indent in (None, 2):
+            with self.assertRaises(TypeError):
+                orjson_dumps(data, indent=indent)
+
+    def test_orjson_dumps_with_non_finite_floats(self):
+        data = [float("nan"), float("inf"), float("-inf")]
+
+        self.assertEqual("[null,null,null]", orjson_dumps(data))
+
+    def test_orjson_dumps_with_non_ascii_text(self):
+        self.assertEqual('["\\u03b1"]', json.dumps(["\u03b1"]))
+        self.assertEqual('["\u03b1"]', orjson_dumps(["\u03b1"]))
+
+    def test_render_with_orjson_dump_factory(self):
+        serializer = JsonSerializer(dump_factory=orjson_dump)
+        obj = TypeC(x=1, y="\u03b1", z=1.5)
+
+        self.assertEqual(
+            '{"x":1,"y":"\u03b1","z":1.5,"fixed":"ignored"}', serializer.render(obj)
+        )
+
+        output = StringIO()
+        serializer.write(output, obj)
+        self.assertEqual(serializer.render(obj), output.getvalue())
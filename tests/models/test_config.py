@@ -1,5 +1,6 @@
 import tempfile
 from pathlib import Path
+from unittest import mock
 from unittest import TestCase
 
 from xsdata import __version__
@@ -30,6 +31,7 @@ class GeneratorConfigTests(TestCase):
             "    <DocstringStyle>reStructuredText</DocstringStyle>\n"
             "    <RelativeImports>false</RelativeImports>\n"
             "    <CompoundFields>false</CompoundFields>\n"
+            "    <ParallelParsing>false</ParallelParsing>\n"
             "  </Output>\n"
             "  <Conventions>\n"
             '    <ClassName case="pascalCase" safePrefix="type"/>\n'
@@ -80,6 +82,7 @@ class GeneratorConfigTests(TestCase):
             "    <DocstringStyle>reStructuredText</DocstringStyle>\n"
             "    <RelativeImports>false</RelativeImports>\n"
             "    <CompoundFields>false</CompoundFields>\n"
+            "    <ParallelParsing>false</ParallelParsing>\n"
             "  </Output>\n"
             "  <Conventions>\n"
             '    <ClassName case="pascalCase" safePrefix="type"/>\n'
@@ -93,6 +96,53 @@ class GeneratorConfigTests(TestCase):
         )
         self.assertEqual(expected, file_path.read_text())
 
+    def test_read_with_cache(self):
+        file_path = Path(tempfile.mktemp())
+        config = GeneratorConfig()
+        config.output.package = "foo"
+        with file_path.open("w") as fp:
+            GeneratorConfig.write(fp, config)
+
+        with mock.patch.object(
+            GeneratorConfig, "parse", wraps=GeneratorConfig.parse
+        ) as mock_parse:
+            first = GeneratorConfig.read(file_path)
+            first.output.package = "bar"
+            second = GeneratorConfig.read(file_path)
+
+            self.assertEqual(1, mock_parse.call_count)
+            self.assertEqual("foo", second.output.package)
+            self.assertIsNot(first.output, second.output)
+
+            config.output.package = "foo.bar"
+            with file_path.open("w") as fp:
+                GeneratorConfig.write(fp, config)
+
+            self.assertEqual("foo.bar", GeneratorConfig.read(file_path).output.package)
+            self.assertEqual(2, mock_parse.call_count)
+
+        file_path.unlink()
+
+    @mock.patch("xsdata.models.config.CONFIG_CACHE_SIZE", 2)
+    @mock.patch.dict("xsdata.models.config.__CONFIG_CACHE__", clear=True)
+    def test_read_with_cache_size(self):
+        paths = [Path(tempfile.mktemp()) for _ in range(3)]
+        for path in paths:
+            with path.open("w") as fp:
+                GeneratorConfig.write(fp, GeneratorConfig())
+
+        with mock.patch.object(
+            GeneratorConfig, "parse", wraps=GeneratorConfig.parse
+        ) as mock_parse:
+            for path in (paths[0], paths[1], paths[0], paths[2], paths[0], paths[1]):
+                GeneratorConfig.read(path)
+
+            actual = [call[0][0] for call in mock_parse.call_args_list]
+            self.assertEqual([paths[0], paths[1], paths[2], paths[1]], actual)
+
+        for path in paths:
+            path.unlink()
+
     def test_read_with_wrong_value(self):
         existing = (
             '<?xml version="1.0" encoding="UTF-8"?>\n'
@@ -4,11 +4,15 @@ from pathlib import Path
 from unittest import mock
 from unittest import TestCase
 
+import click
 from click.testing import CliRunner
 
 from tests import fixtures_dir
 from xsdata.cli import cli
+from xsdata.cli import LazyChoice
+from xsdata.cli import load_plugins
 from xsdata.cli import resolve_source
+from xsdata.cli import run_generate
 from xsdata.codegen.transformer import SchemaTransformer
 from xsdata.codegen.writer import CodeWriter
 from xsdata.formats.dataclass.generator import DataclassGenerator
@@ -50,6 +54,17 @@ class CliTests(TestCase):
         self.assertEqual(StructureStyle.FILENAMES, config.output.structure)
         self.assertEqual([source.as_uri()], mock_process.call_args[0][0])
 
+    @mock.patch.object(SchemaTransformer, "process")
+    @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
+    def test_generate_with_command_name(self, mock_init, mock_process):
+        source = fixtures_dir.joinpath("defxmlschema/chapter03.xsd")
+        result = self.runner.invoke(cli, ["generate", str(source), "-p", "foo"])
+        config = mock_init.call_args[1]["config"]
+
+        self.assertIsNone(result.exception)
+        self.assertEqual("foo", config.output.package)
+        self.assertEqual([source.as_uri()], mock_process.call_args[0][0])
+
     @mock.patch.object(SchemaTransformer, "process")
     @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
     def test_generate_with_print_mode(self, mock_init, mock_process):
@@ -206,6 +221,75 @@ class CliTests(TestCase):
         mock_init.assert_called_once_with(output=Path.cwd().joinpath("here/schemas"))
         mock_wget.assert_called_once_with(uri)
 
+    @mock.patch("xsdata.cli.__PLUGINS_LOADED__", False)
+    @mock.patch("xsdata.cli.load_entry_points")
+    def test_cli_loads_plugins_on_invoke(self, mock_load_entry_points):
+        result = self.runner.invoke(cli, ["--version"])
+
+        self.assertIsNone(result.exception)
+        self.assertEqual(0, mock_load_entry_points.call_count)
+
+        result = self.runner.invoke(cli, ["init-config", "--print"])
+
+        self.assertIsNone(result.exception)
+        mock_load_entry_points.assert_called_once_with("xsdata.plugins.cli")
+
+    @mock.patch("xsdata.cli.__PLUGINS_LOADED__", False)
+    @mock.patch("xsdata.cli.load_entry_points")
+    def test_load_plugins(self, mock_load_entry_points):
+        load_plugins()
+        load_plugins()
+
+        mock_load_entry_points.assert_called_once_with("xsdata.plugins.cli")
+
+    @mock.patch("xsdata.cli.load_plugins")
+    @mock.patch.object(SchemaTransformer, "process")
+    @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
+    def test_run_generate(self, mock_init, mock_process, mock_load_plugins):
+        source = fixtures_dir.joinpath("defxmlschema/chapter03.xsd")
+        run_generate(str(source), package="foo", structure_style="clusters")
+        config = mock_init.call_args[1]["config"]
+
+        mock_load_plugins.assert_called_once_with()
+        self.assertFalse(mock_init.call_args[1]["print"])
+        self.assertEqual("foo", config.output.package)
+        self.assertEqual("dataclasses", config.output.format.value)
+        self.assertEqual(StructureStyle.CLUSTERS, config.output.structure)
+        self.assertEqual([source.as_uri()], mock_process.call_args[0][0])
+
+    @mock.patch.object(SchemaTransformer, "process")
+    @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
+    def test_run_generate_with_print_output(self, mock_init, mock_process):
+        source = fixtures_dir.joinpath("defxmlschema/chapter03.xsd")
+        level = logger.level
+        logger.setLevel(logging.INFO)
+        try:
+            run_generate(str(source), print_output=True)
+            self.assertTrue(mock_init.call_args[1]["print"])
+            self.assertEqual(logging.INFO, logger.level)
+        finally:
+            logger.setLevel(level)
+
+    def test_lazy_choice(self):
+        choices = ["a"]
+        choice = LazyChoice(lambda: choices)
+
+        self.assertEqual("[a]", choice.get_metavar(mock.Mock()))
+        with self.assertRaises(click.BadParameter):
+            choice.convert("b", None, None)
+
+        choices.append("b")
+        self.assertEqual("[a|b]", choice.get_metavar(mock.Mock()))
+        self.assertEqual("b", choice.convert("b", None, None))
+        self.assertEqual(("a", "b"), choice.choices)
+
+        choices.append("c")
+        message = choice.get_missing_message(mock.Mock())
+        self.assertIn("c", message.split())
+
+        completions = choice.shell_complete(mock.Mock(), mock.Mock(), "")
+        self.assertEqual(["a", "b", "c"], [item.value for item in completions])
+
     def test_resolve_source(self):
         hello_path = fixtures_dir.joinpath("hello")
 
@@ -218,3 +302,25 @@ class CliTests(TestCase):
 
         def_xml_path = fixtures_dir.joinpath("calculator")
         self.assertEqual(3, len(list(resolve_source(str(def_xml_path)))))
+
+    def test_resolve_source_with_directory(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir)
+            for name in ("a.json", "b.xml", "c.xsd", "d.wsdl", "e.txt", "f.xsd.bak"):
+                path.joinpath(name).touch()
+            path.joinpath("g.xsd").mkdir()
+
+            expected = [
+                path.joinpath(name).resolve().as_uri()
+                for name in ("d.wsdl", "c.xsd", "b.xml", "a.json")
+            ]
+            self.assertEqual(expected, list(resolve_source(tmp_dir)))
+
+    def test_resolve_source_with_case_insensitive_paths(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir)
+            path.joinpath("A.XSD").touch()
+
+            with mock.patch("xsdata.cli.os.path.normcase", side_effect=str.lower):
+                expected = [path.joinpath("A.XSD").resolve().as_uri()]
+                self.assertEqual(expected, list(resolve_source(tmp_dir)))
@@ -1,37 +1,115 @@
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 import click
 import click_log
-from click_default_group import DefaultGroup
 
 from xsdata import __version__
-from xsdata.codegen.transformer import SchemaTransformer
-from xsdata.codegen.writer import CodeWriter
 from xsdata.logger import logger
-from xsdata.models.config import DocstringStyle
-from xsdata.models.config import GeneratorConfig
-from xsdata.models.config import OutputFormat
-from xsdata.models.config import StructureStyle
-from xsdata.utils.downloader import Downloader
 from xsdata.utils.hooks import load_entry_points
 
-load_entry_points("xsdata.plugins.cli")
 
-outputs = click.Choice(CodeWriter.generators.keys())
-docstring_styles = click.Choice([x.value for x in DocstringStyle])
-structure_styles = click.Choice([x.value for x in StructureStyle])
+class LazyChoice(click.Choice):
+    """
+    Click choice type that evaluates the valid values on demand.
+
+    The cli plugins are loaded when the command group runs, the output
+    formats must not be frozen at import time.
+
+    :param get_choices: Callable that returns the valid values
+    :param case_sensitive: Match the values case sensitively
+    """
+
+    def __init__(
+        self, get_choices: Callable[[], Iterable[str]], case_sensitive: bool = True
+    ):
+        super().__init__([], case_sensitive)
+        self.get_choices = get_choices
+
+    def load_choices(self):
+        """Evaluate the valid values before click accesses them."""
+        self.choices = tuple(self.get_choices())
+
+    def convert(self, *args: Any, **kwargs: Any) -> Any:
+        self.load_choices()
+        return super().convert(*args, **kwargs)
+
+    def get_metavar(self, *args: Any, **kwargs: Any) -> str:
+        self.load_choices()
+        return super().get_metavar(*args, **kwargs)
+
+    def get_missing_message(self, *args: Any, **kwargs: Any) -> str:
+        self.load_choices()
+        return super().get_missing_message(*args, **kwargs)
+
+    def shell_complete(self, *args: Any, **kwargs: Any) -> Any:
+        self.load_choices()
+        return super().shell_complete(*args, **kwargs)
+
+
+class DefaultCommandGroup(click.Group):
+    """
+    Click command group that falls back to the generate command when the
+    first argument is not a known command name.
+
+    Unknown options are ignored on the group level, they are parsed by
+    the resolved command.
+    """
+
+    ignore_unknown_options = True
+
+    def resolve_command(
+        self, ctx: click.Context, args: List[str]
+    ) -> Tuple[Optional[str], Optional[click.Command], List[str]]:
+        if self.get_command(ctx, args[0]) is None:
+            args = ["generate", *args]
+
+        return super().resolve_command(ctx, args)
+
+
+def output_formats() -> Iterable[str]:
+    from xsdata.codegen.writer import CodeWriter
+
+    return CodeWriter.generators.keys()
+
+
+def docstring_style_values() -> Iterable[str]:
+    from xsdata.models.config import DocstringStyle
+
+    return [x.value for x in DocstringStyle]
+
+
+def structure_style_values() -> Iterable[str]:
+    from xsdata.models.config import StructureStyle
+
+    return [x.value for x in StructureStyle]
+
+
+outputs = LazyChoice(output_formats)
+docstring_styles = LazyChoice(docstring_style_values)
+structure_styles = LazyChoice(structure_style_values)
 click_log.basic_config(logger)
 
+SOURCE_EXTENSIONS = (".wsdl", ".xsd", ".xml", ".json")
+__PLUGINS_LOADED__ = False
+
 
-@click.group(cls=DefaultGroup, default="generate", default_if_no_args=False)
+@click.group(cls=DefaultCommandGroup)
 @click.version_option(__version__)
 @click_log.simple_verbosity_option(logger)
 def cli():
     """xsdata command line interface."""
+    load_plugins()
 
 
 @cli.command("init-config")
@@ -39,6 +117,7 @@ def cli():
 @click.option("-pp", "--print", is_flag=True, default=False, help="Print output")
 def init_config(**kwargs: Any):
     """Create or update a configuration file."""
+    from xsdata.models.config import GeneratorConfig
 
     if kwargs["print"]:
         logger.setLevel(logging.ERROR)
@@ -69,7 +148,9 @@ def init_config(**kwargs: Any):
 )
 def download(source: str, output: str):
     """Download a schema or a definition locally with all its dependencies."""
-    downloader = Downloader(output=Path(output).resolve())
+    from xsdata.utils.downloader import Downloader
+
+    downloader = Downloader(output=Path(output))
     downloader.wget(source)
 
 
@@ -161,46 +242,93 @@ def generate(**kwargs: Any):
     The input source can be either a filepath, uri or a directory
     containing xml, json, xsd and wsdl files.
     """
-    if kwargs["print"]:
+    print_output = kwargs.pop("print")
+    if print_output:
         logger.setLevel(logging.ERROR)
 
-    config_file = Path(kwargs["config"])
+    run_generate(print_output=print_output, **kwargs)
+
+
+def run_generate(
+    source: str,
+    config: str = ".xsdata.xml",
+    package: str = "generated",
+    output: str = "dataclasses",
+    docstring_style: str = "reStructuredText",
+    structure_style: str = "filenames",
+    compound_fields: bool = False,
+    relative_imports: bool = False,
+    print_output: bool = False,
+):
+    """
+    Generate code from the given source without the command line parsing.
+
+    The arguments and their defaults match the generate command options,
+    the cli plugins are loaded once per process and the configuration
+    file is only parsed again when it's modified. The logging level is
+    left to the caller, the generate command only logs errors in print
+    mode.
+    """
+    from xsdata.codegen.transformer import SchemaTransformer
+    from xsdata.models.config import DocstringStyle
+    from xsdata.models.config import GeneratorConfig
+    from xsdata.models.config import OutputFormat
+    from xsdata.models.config import StructureStyle
+
+    load_plugins()
+
+    config_file = Path(config)
     if config_file.exists():
-        config = GeneratorConfig.read(config_file)
-        if kwargs["package"] != "generated":
-            config.output.package = kwargs["package"]
+        generator_config = GeneratorConfig.read(config_file)
+        if package != "generated":
+            generator_config.output.package = package
     else:
-        config = GeneratorConfig()
-        config.output.format = OutputFormat(value=kwargs["output"])
-        config.output.package = kwargs["package"]
-        config.output.relative_imports = kwargs["relative_imports"]
-        config.output.compound_fields = kwargs["compound_fields"]
-        config.output.docstring_style = DocstringStyle(kwargs["docstring_style"])
+        generator_config = GeneratorConfig()
+        generator_config.output.format = OutputFormat(value=output)
+        generator_config.output.package = package
+        generator_config.output.relative_imports = relative_imports
+        generator_config.output.compound_fields = compound_fields
+        generator_config.output.docstring_style = DocstringStyle(docstring_style)
 
-    if kwargs["structure_style"] != StructureStyle.FILENAMES.value:
-        config.output.structure = StructureStyle(kwargs["structure_style"])
+    if structure_style != StructureStyle.FILENAMES.value:
+        generator_config.output.structure = StructureStyle(structure_style)
 
-    if kwargs["output"] != "dataclasses":
-        config.output.format.value = kwargs["output"]
+    if output != "dataclasses":
+        generator_config.output.format.value = output
 
-    if kwargs["relative_imports"]:
-        config.output.relative_imports = True
+    if relative_imports:
+        generator_config.output.relative_imports = True
 
-    uris = resolve_source(kwargs["source"])
-    transformer = SchemaTransformer(config=config, print=kwargs["print"])
+    uris = resolve_source(source)
+    transformer = SchemaTransformer(config=generator_config, print=print_output)
     transformer.process(list(uris))
 
 
+def load_plugins():
+    """Load the cli plugins, once per process."""
+    global __PLUGINS_LOADED__
+
+    if not __PLUGINS_LOADED__:
+        load_entry_points("xsdata.plugins.cli")
+        __PLUGINS_LOADED__ = True
+
+
 def resolve_source(source: str) -> Iterator[str]:
     if source.find("://") > -1 and not source.startswith("file://"):
         yield source
     else:
         path = Path(source).resolve()
         if path.is_dir():
-            yield from (x.as_uri() for x in path.glob("*.wsdl"))
-            yield from (x.as_uri() for x in path.glob("*.xsd"))
-            yield from (x.as_uri() for x in path.glob("*.xml"))
-            yield from (x.as_uri() for x in path.glob("*.json"))
+            files: Dict[str, List[str]] = {ext: [] for ext in SOURCE_EXTENSIONS}
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Match case insensitively on windows like Path.glob
+                    ext = os.path.normcase(os.path.splitext(entry.name)[1])
+                    if ext in files and entry.is_file():
+                        files[ext].append(Path(entry.path).as_uri())
+
+            for uris in files.values():
+                yield from uris
         else:  # is file
             yield path.as_uri()
 
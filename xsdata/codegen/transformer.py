@@ -1,7 +1,11 @@
 import io
 import json
+import multiprocessing
 import os
+import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -81,7 +85,7 @@ class SchemaTransformer:
     :param config: Generator configuration
     """
 
-    __slots__ = ("print", "config", "classes", "processed", "preloaded")
+    __slots__ = ("print", "config", "classes", "processed", "preloaded", "preparsed")
 
     def __init__(self, print: bool, config: GeneratorConfig):
         self.print = print
@@ -89,6 +93,7 @@ class SchemaTransformer:
         self.classes: List[Class] = []
         self.processed: List[str] = []
         self.preloaded: Dict = {}
+        self.preparsed: Dict[str, Schema] = {}
 
     def process(self, uris: List[str]):
         sources = defaultdict(list)
@@ -118,9 +123,52 @@ class SchemaTransformer:
 
     def process_schemas(self, uris: List[str]):
         """Process a list of xsd resources."""
+        if self.config.output.parallel_parsing:
+            self.preparse_schemas(uris)
+
         for uri in uris:
             self.process_schema(uri)
 
+    def preparse_schemas(self, uris: List[str]):
+        """
+        Parse the given xsd resources in parallel with a process pool.
+
+        The pool is skipped with less than two workers or inside a child
+        process and the schemas are parsed sequentially if it fails to
+        start or a worker dies.
+
+        The resources are loaded in the main process, the schema trees
+        are kept until they are requested by :meth:`parse_schema`.
+        Imports and includes are still parsed sequentially during the
+        conversion, as they are discovered.
+        """
+        sources = []
+        for uri in uris:
+            if uri in self.processed:
+                continue
+
+            try:
+                src = self.preloaded.get(uri) or urlopen(uri).read()  # nosec
+            except OSError:
+                continue
+
+            self.preloaded[uri] = src
+            sources.append((uri, src))
+
+        max_workers = min(len(sources), os.cpu_count() or 1)
+        if max_workers < 2 or is_child_process():
+            return
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                schemas = list(executor.map(parse_schema_source, sources))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            logger.debug("Process pool unavailable, parsing schemas sequentially")
+            return
+
+        for (uri, _), schema in zip(sources, schemas):
+            self.preparsed[uri] = schema
+
     def process_schema(self, uri: str, namespace: Optional[str] = None):
         """Parse and convert schema to codegen models."""
         schema = self.parse_schema(uri, namespace)
@@ -218,8 +266,11 @@ class SchemaTransformer:
             return None
 
         logger.info("Parsing schema %s", os.path.basename(uri))
-        parser = SchemaParser(target_namespace=namespace, location=uri)
-        return parser.from_bytes(input_stream, Schema)
+        schema = self.preparsed.pop(uri, None)
+        if schema is not None and namespace is None:
+            return schema
+
+        return parse_schema_source((uri, input_stream), namespace)
 
     def parse_definitions(
         self, uri: str, namespace: Optional[str]
@@ -298,3 +349,21 @@ class SchemaTransformer:
             inner += sum(self.count_classes(cls.inner))
 
         return main, inner
+
+
+def parse_schema_source(
+    source: Tuple[str, bytes], namespace: Optional[str] = None
+) -> Schema:
+    """Parse the given uri and contents pair and return the schema tree
+    object."""
+    uri, input_stream = source
+    parser = SchemaParser(target_namespace=namespace, location=uri)
+    return parser.from_bytes(input_stream, Schema)
+
+
+def is_child_process() -> bool:
+    """Return whether the current process was started by multiprocessing."""
+    if sys.version_info >= (3, 8):
+        return multiprocessing.parent_process() is not None
+
+    return multiprocessing.current_process().name != "MainProcess"  # pragma: no cover
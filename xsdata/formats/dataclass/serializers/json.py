@@ -1,20 +1,64 @@
 import json
+import keyword
+import math
+import operator
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
 from io import StringIO
+from json.encoder import encode_basestring_ascii
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Optional
+from typing import Sequence
 from typing import TextIO
 from typing import Tuple
+from typing import Type
+from typing import Union
 
+from xsdata.exceptions import SerializerError
 from xsdata.formats.bindings import AbstractSerializer
 from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.utils import collections
+from xsdata.utils.constants import return_input
+
+
+def orjson_dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """
+    Serialize the given object to a json string with orjson.
+
+    Unlike :func:`json.dumps` the output is not ascii escaped, the
+    separators are compact and non finite floats are written as null.
+    Integers that don't fit in 64 bits are not supported and indentation
+    levels other than two fall back to :func:`json.dumps`.
+
+    :raises TypeError: if the object contains unsupported values
+    """
+    import orjson
+
+    if indent is None or indent == 2:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, option=option).decode()
+
+    return json.dumps(obj, indent=indent)
+
+
+def orjson_dump(obj: Any, fp: TextIO, indent: Optional[int] = None):
+    """Serialize the given object with :func:`orjson_dumps` and write the
+    result to the output text stream."""
+    fp.write(orjson_dumps(obj, indent=indent))
+
+
+NoneType = type(None)
+PRIMITIVE_TYPES = (dict, int, float, str, bool)
+PRIMITIVE_CLASSES = frozenset((NoneType, *PRIMITIVE_TYPES))
+FUSED_TYPES = frozenset((int, float, str, bool))
 
 
 def filter_none(x: Tuple) -> Dict:
@@ -27,6 +71,9 @@ class DictFactory:
     FILTER_NONE = filter_none
 
 
+STREAM_FACTORIES = (dict, filter_none)
+
+
 @dataclass
 class JsonSerializer(AbstractSerializer):
     """
@@ -34,17 +81,29 @@ class JsonSerializer(AbstractSerializer):
 
     :param context: Model context provider
     :param dict_factory: Override default dict factory to add further logic
-    :param dump_factory: Override default json.dump call with another implementation
+    :param dump_factory: Override default json dump call with another implementation
     :param indent: Output indentation level
+    :ivar vars_cache: Class to binding vars cache
+    :ivar encoders: Class to model encoder cache
     """
 
     context: XmlContext = field(default_factory=XmlContext)
     dict_factory: Callable = field(default=dict)
     dump_factory: Callable = field(default=json.dump)
     indent: Optional[int] = field(default=None)
+    vars_cache: Dict = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    encoders: Dict = field(init=False, default_factory=dict, repr=False, compare=False)
 
     def render(self, obj: object) -> str:
         """Convert the given object tree to json string."""
+        if self.dump_factory is json.dump:
+            return json.dumps(self.convert_root(obj), indent=self.indent)
+
+        if self.dump_factory is orjson_dump:
+            return orjson_dumps(self.convert_root(obj), indent=self.indent)
+
         output = StringIO()
         self.write(output, obj)
         return output.getvalue()
@@ -56,28 +115,444 @@ class JsonSerializer(AbstractSerializer):
         :param out: The output stream
         :param obj: The input dataclass instance
         """
-        self.dump_factory(self.convert(obj), out, indent=self.indent)
+        if self.dump_factory is json.dump and self.dict_factory in STREAM_FACTORIES:
+            self.write_stream(out, obj)
+        else:
+            self.dump_factory(self.convert_root(obj), out, indent=self.indent)
+
+    def write_stream(self, out: TextIO, obj: Any):
+        """
+        Write the given object tree to the output text stream without
+        converting it to an intermediate dictionary first.
+
+        The output is identical to :func:`json.dump` but only the
+        builtin dict factories are supported.
+
+        :param out: The output stream
+        :param obj: The input dataclass instance
+        :raises SerializerError: if the dict factory is not supported
+        """
+        if self.dict_factory not in STREAM_FACTORIES:
+            raise SerializerError("Streaming doesn't support custom dict factories")
+
+        writer = JsonStreamWriter(self, out)
+        writer.write_value(obj, None, 0)
 
     def convert(self, obj: Any, var: Optional[XmlVar] = None) -> Any:
-        if var is None or self.context.class_type.is_model(obj):
+        """
+        Convert a root object or a var value to json compatible data.
 
-            if collections.is_array(obj):
-                return [self.convert(o) for o in obj]
+        :param obj: The input dataclass instance, list of instances or value
+        :param var: The var the value belongs to, None for root objects
+        """
+        if var is None:
+            return self.convert_root(obj)
 
-            return self.dict_factory(
-                [
-                    (var.local_name, self.convert(getattr(obj, var.name), var))
-                    for var in self.context.build(obj.__class__).get_all_vars()
-                ]
-            )
+        return self.convert_child(obj, var)
+
+    def convert_root(self, obj: Any) -> Any:
+        """Convert a dataclass instance or a list of instances."""
+        clazz = obj.__class__
+        if clazz is list or clazz is tuple or collections.is_array(obj):
+            return [self.convert_root(o) for o in obj]
 
-        if collections.is_array(obj):
-            return type(obj)(self.convert(v, var) for v in obj)
+        return self.convert_model(obj)
 
-        if isinstance(obj, (dict, int, float, str, bool)):
+    def convert_child(self, obj: Any, var: XmlVar) -> Any:
+        """Convert a var value."""
+        clazz = obj.__class__
+        if clazz in PRIMITIVE_CLASSES:
+            return obj
+
+        if clazz is list:
+            return [self.convert_child(v, var) for v in obj]
+
+        if clazz is tuple or collections.is_array(obj):
+            return clazz(self.convert_child(v, var) for v in obj)
+
+        if self.context.class_type.is_model(obj):
+            return self.convert_model(obj)
+
+        if isinstance(obj, PRIMITIVE_TYPES):
             return obj
 
         if isinstance(obj, Enum):
-            return self.convert(obj.value, var)
+            return self.convert_child(obj.value, var)
+
+        return self.serialize_value(obj, var.format)
+
+    @classmethod
+    def serialize_value(cls, value: Any, fmt: Optional[str]) -> Any:
+        """
+        Convert a simple value to string.
+
+        Values with a converter registered for their exact type skip the
+        converter factory dispatch.
+        """
+        instance = converter.registry.get(value.__class__)
+        if instance is None:
+            return converter.serialize(value, format=fmt)
+
+        return instance.serialize(value, format=fmt)
+
+    def convert_model(self, obj: Any) -> Any:
+        """Convert the given model instance with the encoder of its class."""
+        encoder = self.encoders.get(obj.__class__)
+        if encoder is None:
+            encoder = self.build_encoder(obj.__class__)
+
+        return encoder(obj)
+
+    def build_encoder(self, clazz: Type) -> Callable[[Any], Any]:
+        """Build and cache the function that converts instances of the given
+        class to a dictionary."""
+        xml_vars = self.find_vars(clazz)
+        spec = [
+            (
+                var.local_name,
+                operator.attrgetter(var.name),
+                self.build_value_encoder(var),
+            )
+            for var in xml_vars
+        ]
+
+        def encoder(obj: Any) -> Any:
+            dict_factory = self.dict_factory
+            if dict_factory is dict:
+                return {key: encode(getter(obj)) for key, getter, encode in spec}
+
+            return dict_factory(
+                [(key, encode(getter(obj))) for key, getter, encode in spec]
+            )
+
+        result: Callable[[Any], Any] = encoder
+        if xml_vars and all(self.is_primitive_var(var) for var in xml_vars):
+            result = self.build_primitive_encoder(clazz, xml_vars, encoder)
+
+        self.encoders[clazz] = result
+        return result
+
+    def build_primitive_encoder(
+        self,
+        clazz: Type,
+        xml_vars: Sequence[XmlVar],
+        fallback: Callable[[Any], Any],
+    ) -> Callable[[Any], Any]:
+        """
+        Compile the encoder of a class with only primitive vars.
+
+        The generated function reads the attributes directly and builds
+        the dictionary in one step, as long as every value is of a
+        primitive class, otherwise the fallback encoder is used.
+        """
+        names = [f"v{index}" for index in range(len(xml_vars))]
+        pairs = ", ".join(
+            f"({var.local_name!r}, {name})" for var, name in zip(xml_vars, names)
+        )
+        items = ", ".join(
+            f"{var.local_name!r}: {name}" for var, name in zip(xml_vars, names)
+        )
+        condition = " and ".join(f"{name}.__class__ in primitives" for name in names)
+        lines = [
+            "def encoder(obj):",
+            *(f"    {name} = obj.{var.name}" for var, name in zip(xml_vars, names)),
+            f"    if {condition}:",
+            "        dict_factory = serializer.dict_factory",
+            "        if dict_factory is dict:",
+            f"            return {{{items}}}",
+            f"        return dict_factory([{pairs}])",
+            "    return fallback(obj)",
+        ]
+        namespace: Dict[str, Any] = {
+            "serializer": self,
+            "primitives": PRIMITIVE_CLASSES,
+            "fallback": fallback,
+        }
+        code = compile("\n".join(lines), f"<json encoder {clazz.__qualname__}>", "exec")
+        exec(code, namespace)
+        return namespace["encoder"]
+
+    @classmethod
+    def is_primitive_var(cls, var: XmlVar) -> bool:
+        """Return whether the var is declared with primitive types only and
+        its name can be used as an attribute in generated code."""
+        return (
+            not (var.clazz or var.any_type or var.list_element or var.tokens)
+            and var.format is None
+            and all(tp in FUSED_TYPES for tp in var.types)
+            and var.name.isidentifier()
+            and not keyword.iskeyword(var.name)
+        )
+
+    def build_value_encoder(self, var: XmlVar) -> Callable[[Any], Any]:
+        """
+        Return the function that converts the values of the given var.
+
+        The conversion of every declared type of the var is resolved
+        once, values of any other type fall back to :meth:`convert_child`.
+        """
+
+        def convert(value: Any) -> Any:
+            return self.convert_child(value, var)
+
+        if var.any_type or var.tokens:
+            return convert
+
+        types = set(var.types)
+        if types.issubset(PRIMITIVE_TYPES):
+
+            def encode_item(value: Any) -> Any:
+                if value.__class__ in types:
+                    return value
+
+                return convert(value)
+
+        else:
+            handlers: Dict[Type, Callable[[Any], Any]] = {NoneType: return_input}
+            for tp in types:
+                handler = self.build_type_handler(tp, var, convert)
+                if handler is not None:
+                    handlers[tp] = handler
+
+            def encode_item(value: Any) -> Any:
+                handler = handlers.get(value.__class__)
+                if handler is None:
+                    return convert(value)
+
+                return handler(value)
+
+        if not var.list_element:
+            return encode_item
+
+        def encode_list(value: Any) -> Any:
+            if value.__class__ is list:
+                return [encode_item(item) for item in value]
+
+            return convert(value)
+
+        return encode_list
+
+    def build_type_handler(
+        self, tp: Type, var: XmlVar, convert: Callable[[Any], Any]
+    ) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function that converts the var values of the exact given
+        type, in the same order as :meth:`convert_child`.
+
+        Arrays are left to :meth:`convert_child`.
+        """
+        if tp in PRIMITIVE_CLASSES:
+            return return_input
+
+        if issubclass(tp, (list, tuple)) and not hasattr(tp, "_fields"):
+            return None
+
+        if self.context.class_type.is_model(tp):
+            return self.convert_model
+
+        if issubclass(tp, PRIMITIVE_TYPES):
+            return return_input
+
+        if issubclass(tp, Enum):
+            return lambda value: convert(value.value)
+
+        fmt = var.format
+        return lambda value: self.serialize_value(value, fmt)
+
+    def find_vars(self, clazz: Type) -> Tuple[XmlVar, ...]:
+        """Fetch from cache or build the list of the class binding vars."""
+        xml_vars = self.vars_cache.get(clazz)
+        if xml_vars is None:
+            xml_vars = tuple(self.context.build(clazz).get_all_vars())
+            self.vars_cache[clazz] = xml_vars
+
+        return xml_vars
+
+
+class JsonStreamWriter:
+    """
+    Write the json representation of an object tree token by token to the
+    output text stream.
+
+    Models and arrays are walked directly, every other value is first
+    converted by the serializer and then encoded like :func:`json.dump`.
+
+    :param serializer: The json serializer instance
+    :param out: The output stream
+    """
+
+    __slots__ = ("serializer", "write", "indent", "item_separator", "skip_none")
+
+    def __init__(self, serializer: JsonSerializer, out: TextIO):
+        indent: Union[int, str, None] = serializer.indent
+        if isinstance(indent, int):
+            indent = " " * indent
+
+        self.serializer = serializer
+        self.write = out.write
+        self.indent = indent
+        self.item_separator = ", " if indent is None else ","
+        self.skip_none = serializer.dict_factory is filter_none
+
+    def write_value(self, obj: Any, var: Optional[XmlVar], level: int):
+        """Write a root object or a var value."""
+        serializer = self.serializer
+        clazz = obj.__class__
+        is_array = clazz is list or clazz is tuple
+        if var is None:
+            if is_array or collections.is_array(obj):
+                self.write_array(obj, level, self.write_root)
+            else:
+                self.write_model(obj, level)
+        elif clazz in PRIMITIVE_CLASSES:
+            self.write_data(obj, level)
+        elif is_array or collections.is_array(obj):
+            self.write_array(
+                obj, level, lambda value, depth: self.write_value(value, var, depth)
+            )
+        elif serializer.context.class_type.is_model(obj):
+            self.write_model(obj, level)
+        else:
+            self.write_data(serializer.convert_child(obj, var), level)
+
+    def write_root(self, obj: Any, level: int):
+        self.write_value(obj, None, level)
+
+    def write_model(self, obj: Any, level: int):
+        """Write a model instance as a json object with the var local names
+        as keys."""
+        serializer = self.serializer
+        is_model = serializer.context.class_type.is_model
+        xml_vars = serializer.find_vars(obj.__class__)
+        write = self.write
+        newline = self.newline(level + 1)
+        separator = self.item_separator + newline
+        empty = True
+
+        write("{")
+        for var in xml_vars:
+            value = getattr(obj, var.name)
+            clazz = value.__class__
+            is_data = clazz in PRIMITIVE_CLASSES or not (
+                clazz is list
+                or clazz is tuple
+                or collections.is_array(value)
+                or is_model(value)
+            )
+            if is_data:
+                value = serializer.convert_child(value, var)
+                if value is None and self.skip_none:
+                    continue
+
+            write(newline if empty else separator)
+            write(encode_basestring_ascii(var.local_name))
+            write(": ")
+            if is_data:
+                self.write_data(value, level + 1)
+            else:
+                self.write_value(value, var, level + 1)
+
+            empty = False
+
+        if not empty:
+            write(self.newline(level))
+
+        write("}")
+
+    def write_array(
+        self, items: Sequence, level: int, write_item: Callable[[Any, int], None]
+    ):
+        """Write a sequence as a json array with the given item callback."""
+        if not items:
+            self.write("[]")
+            return
+
+        newline = self.newline(level + 1)
+        separator = self.item_separator + newline
+        self.write("[")
+        self.write(newline)
+        for index, item in enumerate(items):
+            if index:
+                self.write(separator)
+
+            write_item(item, level + 1)
+
+        self.write(self.newline(level))
+        self.write("]")
+
+    def write_data(self, data: Any, level: int):
+        """Write an already converted value like :func:`json.dump`."""
+        if isinstance(data, str):
+            self.write(encode_basestring_ascii(data))
+        elif data is None:
+            self.write("null")
+        elif data is True:
+            self.write("true")
+        elif data is False:
+            self.write("false")
+        elif isinstance(data, int):
+            self.write(int.__repr__(data))
+        elif isinstance(data, float):
+            self.write(self.encode_float(data))
+        elif isinstance(data, (list, tuple)):
+            self.write_array(data, level, self.write_data)
+        elif isinstance(data, dict):
+            self.write_data_object(data, level)
+        else:
+            self.write(json.dumps(data))
+
+    def write_data_object(self, data: Dict, level: int):
+        """Write an already converted dictionary like :func:`json.dump`."""
+        if not data:
+            self.write("{}")
+            return
+
+        newline = self.newline(level + 1)
+        separator = self.item_separator + newline
+        self.write("{")
+        self.write(newline)
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                self.write(separator)
+
+            self.write(encode_basestring_ascii(self.encode_key(key)))
+            self.write(": ")
+            self.write_data(value, level + 1)
+
+        self.write(self.newline(level))
+        self.write("}")
+
+    def newline(self, level: int) -> str:
+        if self.indent is None:
+            return ""
+
+        return "\n" + self.indent * level
+
+    @classmethod
+    def encode_key(cls, key: Any) -> str:
+        if isinstance(key, str):
+            return key
+        if key is None:
+            return "null"
+        if key is True:
+            return "true"
+        if key is False:
+            return "false"
+        if isinstance(key, int):
+            return int.__repr__(key)
+        if isinstance(key, float):
+            return cls.encode_float(key)
+
+        raise TypeError(
+            f"keys must be str, int, float, bool or None, "
+            f"not {key.__class__.__name__}"
+        )
+
+    @classmethod
+    def encode_float(cls, value: float) -> str:
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
 
-        return converter.serialize(obj, format=var.format)
+        return float.__repr__(value)
@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
@@ -7,6 +8,8 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import TextIO
+from typing import Tuple
+from typing import Type
 
 from xsdata import __version__
 from xsdata.exceptions import GeneratorConfigError
@@ -162,6 +165,8 @@ class GeneratorOutput:
     :param relative_imports: Enable relative imports
     :param compound_fields: Use compound fields for repeating choices.
         Enable if elements ordering matters for your case.
+    :param parallel_parsing: Parse the input xsd resources in a process
+        pool, enable for large sets of schemas on multicore machines.
     """
 
     max_line_length: int = attribute(default=79)
@@ -171,6 +176,7 @@ class GeneratorOutput:
     docstring_style: DocstringStyle = element(default=DocstringStyle.RST)
     relative_imports: bool = element(default=False)
     compound_fields: bool = element(default=False)
+    parallel_parsing: bool = element(default=False)
 
 
 @dataclass
@@ -296,6 +302,28 @@ class GeneratorConfig:
 
     @classmethod
     def read(cls, path: Path) -> "GeneratorConfig":
+        """
+        Parse the configuration file or return a copy of the cached
+        instance, if the file modification time and size haven't changed
+        since the last read.
+
+        Only the most recently read files are kept in the cache.
+        """
+        stat = path.stat()
+        key = (cls, str(path.resolve()))
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = __CONFIG_CACHE__.pop(key, None)
+        if cached is None or cached[0] != signature:
+            cached = (signature, cls.parse(path))
+
+        __CONFIG_CACHE__[key] = cached
+        if len(__CONFIG_CACHE__) > CONFIG_CACHE_SIZE:
+            del __CONFIG_CACHE__[next(iter(__CONFIG_CACHE__))]
+
+        return copy.deepcopy(cached[1])
+
+    @classmethod
+    def parse(cls, path: Path) -> "GeneratorConfig":
         ctx = XmlContext(
             element_name_generator=text.pascal_case,
             attribute_name_generator=text.camel_case,
@@ -316,3 +344,7 @@ class GeneratorConfig:
         config = SerializerConfig(pretty_print=True)
         serializer = XmlSerializer(context=ctx, config=config, writer=XmlEventWriter)
         serializer.write(output, obj, ns_map={None: "http://pypi.org/project/xsdata"})
+
+
+CONFIG_CACHE_SIZE = 16
+__CONFIG_CACHE__: Dict[Tuple[Type, str], Tuple[Tuple[int, int], GeneratorConfig]] = {}